@@ -1,19 +1,37 @@
 from __future__ import annotations
 
 import functools
+import heapq
 import math
-from collections import Counter
+import os
+import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
+import numpy as np
 import vapoursynth as vs
-from more_itertools import split_at
 from pyd2v import D2V
 from pymediainfo import MediaInfo
 from vapoursynth import core
 
 from mpgg.utilities import get_aspect_ratio, get_par, get_standard, group_numbers, list_select_every
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _get_section_gap_mode(indexes: np.ndarray) -> int:
+    """Get the most common gap between paired pulldown indexes of a section."""
+    gaps = indexes[1::2] - indexes[0::2][:indexes.size // 2]
+    return int(np.bincount(gaps).argmax())
+
+
+if njit:
+    # JIT-compile the hot arithmetic when numba is available (`pip install mpgg[numba]`)
+    _get_section_gap_mode = njit(cache=True)(_get_section_gap_mode)
+
 
 class MPGG:
     def __init__(self, file: str, verbose: bool = False):
@@ -43,20 +61,55 @@ class MPGG:
                 "See https://github.com/dwbuiten/d2vsource"
             )
 
-        # TODO: Somehow add a check that the D2V was indexed by pyd2v
-        self.d2v = D2V.load(Path(file))
+        self._path = Path(file)
+        self._d2v: Optional[D2V] = None
+
+        # a D2V indexed from `file` sits next to it with a .d2v extension, and
+        # so does the derived-data cache written by a previous load of it
+        d2v_path = self._path.with_suffix(".d2v")
+        cache = self._read_flags_cache(d2v_path) if d2v_path.is_file() else None
+
+        if cache is not None:
+            # the derived data is intact, skip the costly D2V text re-parse entirely
+            self.file = d2v_path
+            columns = {
+                name[len("flag_"):]: cache[name].tolist()
+                for name in cache
+                if name.startswith("flag_")
+            }
+            self.flags = [dict(zip(columns, row)) for row in zip(*columns.values())]
+            self.flag_cols = self._get_flag_cols(self.flags)
+            self.pulldown = int(cache["pulldown"])
+            self.pulldown_str = str(cache["pulldown_str"]) or None
+            dar = str(cache["dar"])
+            first_video = str(cache["videos"][0])
+        else:
+            # TODO: Somehow add a check that the D2V was indexed by pyd2v
+            self._d2v = D2V.load(self._path)
+            self.file = self._d2v.path
+            self.flags = self._get_flags(self._d2v)
+            self.flag_cols = self._get_flag_cols(self.flags)
+            self.pulldown, self.pulldown_str = self._get_pulldown(self.flag_cols)
+            dar = self._d2v.settings["Aspect_Ratio"]
+            if isinstance(dar, list):
+                dar = dar[0]
+            first_video = self._d2v.videos[0]
+            self._write_flags_cache(
+                self.file, self.flags, self.pulldown, self.pulldown_str, str(dar), self._d2v.videos
+            )
 
-        self.file = self.d2v.path
-        self.flags = self._get_flags(self.d2v)
-        self.pulldown, self.pulldown_str = self._get_pulldown(self.flags)
         self.total_frames = len(self.flags)
-        self.p_frames = sum(f["progressive_frame"] for f in self.flags)
+        self.p_frames = int(self.flag_cols["progressive_frame"].sum())
         self.i_frames = self.total_frames - self.p_frames
+        self._recovered = False
 
         # A DVD-spec MPEG stream is considered VFR if there's interlaced and progressive frames,
         # otherwise it would only ever be NTSC (30000/1001i) or PAL (25i), therefore constant.
-        self.vfr = any(f["progressive_frame"] and f["rff"] and f["tff"] for f in self.flags) and any(
-            not f["progressive_frame"] for f in self.flags)
+        progressive = self.flag_cols["progressive_frame"]
+        self.vfr = bool(
+            (progressive & self.flag_cols["rff"] & self.flag_cols["tff"]).any() and
+            not progressive.all()
+        )
 
         # Do not apply RFF (Repeat First Field) as this would be the flags for Software Pulldown.
         # We do not want to cause further interlacing. Instead, we will handle this later using
@@ -70,7 +123,9 @@ class MPGG:
         # Override the _ColorRange value set by core.d2v.Source with one obtained from
         # the container/stream if available, or fallback and assume limited/TV.
         # This makes YUVRGB_Scale setting redundant to reduce possibilities of mistakes.
-        video_track = next(iter(MediaInfo.parse(self.d2v.videos[0]).video_tracks), None)
+        # only the stream header is needed for color range, a full-speed parse
+        # would needlessly scan a chunk of the MPEG stream itself
+        video_track = next(iter(MediaInfo.parse(first_video, parse_speed=0.0).video_tracks), None)
         if video_track and getattr(video_track, "color_range", None):
             color_range = {"Full": 0, "Limited": 1}[video_track.color_range]
         else:
@@ -78,9 +133,7 @@ class MPGG:
         self.clip = core.std.SetFrameProp(self.clip, "_ColorRange", color_range)
 
         self.standard = get_standard(self.clip.fps.numerator / self.clip.fps.denominator)
-        self.dar = self.d2v.settings["Aspect_Ratio"]
-        if isinstance(self.dar, list):
-            self.dar = self.dar[0]
+        self.dar = dar
         self.sar = get_aspect_ratio(self.clip.width, self.clip.height)
         self.par = get_par(self.clip.width, self.clip.height, *[int(x) for x in self.dar.split(":")])
 
@@ -107,6 +160,18 @@ class MPGG:
             self.floor()
             self.pulldown = None
 
+    @property
+    def d2v(self) -> D2V:
+        """
+        The parsed D2V project file.
+
+        Cached constructions do not need to re-parse the D2V, so it is loaded
+        lazily here on first access instead.
+        """
+        if self._d2v is None:
+            self._d2v = D2V.load(self._path)
+        return self._d2v
+
     def recover(self, verbose=False, **kwargs):
         """
         Recovers progressive frames from an interlaced clip using VIVTC VFM.
@@ -126,33 +191,59 @@ class MPGG:
         if not isinstance(self.clip, vs.VideoNode):
             raise TypeError("This is not a clip")
 
+        if not self.i_frames:
+            # every frame is already progressive, matching would be a no-op
+            if verbose:
+                self.clip = core.text.Text(self.clip, "Progressive", alignment=3)
+            return self
+
         matched_tff = core.vivtc.VFM(self.clip, order=1, **kwargs)
         matched_bff = core.vivtc.VFM(self.clip, order=0, **kwargs)
 
+        # VFM may return a different format, convert once upfront instead of
+        # guarding the format on every progressive frame in the callback
+        source = self.clip
+        if source.format and matched_tff.format and source.format.id != matched_tff.format.id:
+            source = core.resize.Point(source, format=matched_tff.format.id)
+
+        progressive = self.flag_cols["progressive_frame"]
+
+        # build the verbose overlays once upfront, a text.Text node per frame
+        # inside the callback adds up fast on long titles
+        overlays: dict[tuple[int, int], vs.VideoNode] = {}
+        progressive_overlay = None
+        if verbose:
+            overlays = {
+                (order, combed): core.text.Text(
+                    order_clip,
+                    "Matched (%s)" % {0: "Recovered", 1: "Combed <!>"}[combed],
+                    alignment=3
+                )
+                for order, order_clip in enumerate((source, matched_bff, matched_tff))
+                for combed in (0, 1)
+            }
+            progressive_overlay = core.text.Text(source, "Progressive", alignment=3)
+
         def _m(n: int, f: vs.VideoFrame, c: vs.VideoNode, tff: vs.VideoNode, bff: vs.VideoNode):
             # frame marked as progressive, skip matching
-            if f.props["PVSFlagProgressiveFrame"] or f.props.get("_Combed") == 0:
-                if c.format and tff.format and c.format.id != tff.format.id:
-                    c = core.resize.Point(c, format=tff.format.id)
-                return core.text.Text(c, "Progressive", alignment=3) if verbose else c
+            if progressive[n] or f.props.get("_Combed") == 0:
+                return progressive_overlay if verbose else c
             # interlaced frame, match (if _FieldBased is > 0)
-            rc = {0: c, 1: bff, 2: tff}[f.props["_FieldBased"]]  # type: ignore
-            return core.text.Text(
-                rc,
-                "Matched (%s)" % {0: "Recovered", 1: "Combed <!>"}[rc.get_frame(n).props["_Combed"]],
-                alignment=3
-            ) if verbose else rc
+            order = f.props["_FieldBased"]
+            rc = (c, bff, tff)[order]  # type: ignore
+            return overlays[(order, rc.get_frame(n).props["_Combed"])] if verbose else rc
 
         self.clip = core.std.FrameEval(
             matched_tff,
             functools.partial(
                 _m,
-                c=self.clip,
+                c=source,
                 tff=matched_tff,
                 bff=matched_bff
             ),
             prop_src=self.clip
         )
+        self._recovered = True
         return self
 
     def deinterlace(self, kernel: functools.partial, verbose: bool = False) -> MPGG:
@@ -192,6 +283,12 @@ class MPGG:
             # causes conflicts with the clip positional argument
             raise ValueError("Invalid kernel arguments, no positional arguments are allowed")
 
+        if not self.i_frames:
+            # every frame is already progressive, nothing to deinterlace
+            if verbose:
+                self.clip = core.text.Text(self.clip, "Progressive", alignment=3)
+            return self
+
         deinterlaced_tff = kernel(self.clip, TFF=True)
         deinterlaced_bff = kernel(self.clip, TFF=False)
 
@@ -204,55 +301,72 @@ class MPGG:
                 "Only single-rate and double-rate deinterlacing is currently supported."
             )
 
-        def _d(n: int, c: vs.VideoNode, tff: vs.VideoNode, bff: vs.VideoNode, ff: float):
+        # the kernel may return a different format, convert once upfront instead of
+        # guarding the format on every progressive frame in the callback
+        source = self.clip
+        if source.format and deinterlaced_tff.format and source.format.id != deinterlaced_tff.format.id:
+            source = core.resize.Spline16(source, format=deinterlaced_tff.format.id)
+        if fps_factor > 1:
+            # duplicate if not a single-rate fps output
+            source = core.std.Interleave([source] * int(fps_factor))  # TODO: floor/ceil instead?
+
+        progressive = self.flag_cols["progressive_frame"]
+
+        # if recover() was used, its verbose overlay shares our alignment, so
+        # flagged-progressive frames need the spaced overlay to keep it visible
+        spaced_progressive = self._recovered
+
+        # build the verbose overlays once upfront, a text.Text node per frame
+        # inside the callback adds up fast on long titles
+        overlays: dict[tuple[int, bool], vs.VideoNode] = {}
+        if verbose:
+            for field_order, order_clip, label in (
+                (0, source, "Progressive"),
+                (1, deinterlaced_bff, "Deinterlaced (BFF)"),
+                (2, deinterlaced_tff, "Deinterlaced (TFF)"),
+            ):
+                overlays[(field_order, False)] = core.text.Text(order_clip, label, alignment=3)
+                # spaced variant to keep recover()'s verbose logs visible
+                overlays[(field_order, True)] = core.text.Text(order_clip, label + "\n", alignment=3)
+
+        def _d(n: int, c: vs.VideoNode, pc: vs.VideoNode, tff: vs.VideoNode, bff: vs.VideoNode, ff: float):
             # `n` is relative of `deinterlaced_tff` so fix the index to be relative of `clip` instead
             real_n = math.floor(n / ff)
-            props = c[real_n].get_frame(0).props
-
-            field_order = props["_FieldBased"]
-            combed = props.get("_Combed")
-            text = None
-
-            if combed == 1:
-                # we lost field order info by using VFM, we must rely on _Combed and VFMMatch now
-                field_order = {
-                    0: 1,  # p
-                    1: 2,  # c
-                    2: 1,  # n (assuming? tested with field=3 and works)
-                    3: 2,  # b (assuming inverted, untested)
-                    4: 1,  # u (assuming inverted, untested)
-                }[props["VFMMatch"]]
-
-            if field_order == 0 or props["PVSFlagProgressiveFrame"]:
-                # == Progressive ==
-                rc = c
-                # duplicate if not a single-rate fps output
-                if ff > 1:
-                    rc = core.std.Interleave([rc] * int(ff))  # TODO: floor/ceil instead?
-                if rc.format and tff.format and rc.format.id != tff.format.id:
-                    rc = core.resize.Spline16(rc, format=tff.format.id)
-                if verbose:
-                    text = "Progressive"
-            else:
-                # == Interlaced ==
-                rc = {1: bff, 2: tff}[field_order]
-                if verbose:
-                    field_order_s = {1: "BFF", 2: "TFF"}[field_order]
-                    text = f"Deinterlaced ({field_order_s})"
 
-            if text:
-                if combed is not None:
-                    # space it to keep recover()'s verbose logs visible
-                    text += "\n"
-                rc = core.text.Text(rc, text, alignment=3)
-
-            return rc
+            if progressive[real_n]:
+                # flag data already says it's progressive, skip rendering the frame for its props
+                field_order = 0
+                spaced = spaced_progressive
+            else:
+                props = c[real_n].get_frame(0).props
+                field_order = props["_FieldBased"]
+                combed = props.get("_Combed")
+                spaced = combed is not None
+                if combed == 1:
+                    # we lost field order info by using VFM, we must rely on _Combed and VFMMatch now
+                    field_order = (
+                        1,  # p
+                        2,  # c
+                        1,  # n (assuming? tested with field=3 and works)
+                        2,  # b (assuming inverted, untested)
+                        1,  # u (assuming inverted, untested)
+                    )[props["VFMMatch"]]
+
+            if verbose:
+                return overlays[(field_order, spaced)]
+
+            if field_order == 0:
+                # == Progressive ==
+                return pc
+            # == Interlaced ==
+            return (None, bff, tff)[field_order]
 
         self.clip = core.std.FrameEval(
             deinterlaced_tff,
             functools.partial(
                 _d,
                 c=self.clip,
+                pc=source,
                 tff=deinterlaced_tff,
                 bff=deinterlaced_bff,
                 ff=fps_factor
@@ -272,21 +386,24 @@ class MPGG:
         if not self.vfr:
             return self
 
-        pf = [i for i, f in enumerate(self.flags) if f["progressive_frame"] and f["rff"] and f["tff"]]
+        pf = np.flatnonzero(
+            self.flag_cols["progressive_frame"] & self.flag_cols["rff"] & self.flag_cols["tff"]
+        )
 
-        self.clip = core.std.DuplicateFrames(self.clip, pf)
+        self.clip = core.std.DuplicateFrames(self.clip, pf.tolist())
 
-        def disable_rff(n: int, f: vs.VideoFrame) -> vs.VideoFrame:
-            f = f.copy()
-            f.props["PVSFlagRff"] = 0
-            return f
+        # the RFF flags are now applied, disable them on every frame
+        self.clip = core.std.SetFrameProp(self.clip, prop="PVSFlagRff", intval=0)
 
-        self.clip = core.std.ModifyFrame(self.clip, self.clip, disable_rff)
-        self.flags = [
-            flag
-            for i, f in enumerate(self.flags)
-            for flag in [dict(f, rff=False)] * (2 if i in pf else 1)
-        ]
+        pf_set = set(pf.tolist())
+        flags = []
+        for i, f in enumerate(self.flags):
+            flag = dict(f, rff=False)
+            flags.append(flag)
+            if i in pf_set:
+                flags.append(flag)
+        self.flags = flags
+        self.flag_cols = self._get_flag_cols(self.flags)
 
         self.vfr = False
         return self
@@ -319,17 +436,20 @@ class MPGG:
             progressive_sections = group_numbers([n for n, f in enumerate(self.flags) if f["progressive_frame"]])
             interlaced_sections = group_numbers([n for n, f in enumerate(self.flags) if not f["progressive_frame"]])
 
-            self.clip = core.std.Splice([x for _, x in sorted(
-                [
+            # both section lists are already ordered by first frame #, so splice
+            # them back together with a linear merge instead of a full sort
+            self.clip = core.std.Splice([x for _, x in heapq.merge(
+                (
                     (
-                        x[0],  # first frame # of the section, used for sorting when splicing
+                        x[0],  # first frame # of the section, used for ordering when splicing
                         core.std.AssumeFPS(
                             self.clip[x[0]:x[-1] + 1],
                             fpsnum=wanted_fps_num,
                             fpsden=self.clip.fps.denominator
                         )
                     ) for x in progressive_sections
-                ] + [
+                ),
+                (
                     (
                         x[0],
                         core.std.SelectEvery(
@@ -338,61 +458,149 @@ class MPGG:
                             offsets
                         )
                     ) for x in interlaced_sections
-                ],
-                key=lambda section: int(section[0])
+                ),
+                key=lambda section: section[0]
             )])
-            interlaced_frames = [
+            interlaced_frames = {
                 n
                 for s in interlaced_sections
                 for n in list_select_every(s, cycle, offsets, inverse=True)
-            ]
+            }
             self.flags = [f for i, f in enumerate(self.flags) if i not in interlaced_frames]
+            self.flag_cols = self._get_flag_cols(self.flags)
             self.vfr = False
         return self
 
     @staticmethod
     def _stamp_frames(clip: vs.VideoNode, flags: list[dict]) -> vs.VideoNode:
         """Stamp frames with prop data that may be needed."""
-
-        def _set_flag_props(n, f, c, fl):
-            for key, value in fl[n].items():
+        frame_props = []
+        for flag in flags:
+            props = {}
+            for key, value in flag.items():
                 if isinstance(value, bool):
                     value = 1 if value else 0
                 if isinstance(value, bytes):
                     value = value.decode("utf-8")
-                c = core.std.SetFrameProp(c, **{
-                    ("intval" if isinstance(value, int) else "data"): value
-                }, prop="PVSFlag%s" % key.title().replace("_", ""))
-            return c[n]
+                props["PVSFlag%s" % key.title().replace("_", "")] = value
+            frame_props.append(props)
+
+        def _set_flag_props(n: int, f: vs.VideoFrame) -> vs.VideoFrame:
+            f = f.copy()
+            f.props.update(frame_props[n])
+            return f
 
-        vob_indexes = [v for _, v in {f["vob"]: n for n, f in enumerate(flags)}.items()]
+        # vob ids are contiguous runs, so the last frame # of each vob sits right
+        # before every vob change (and at the very end of the clip)
+        vobs = np.fromiter((f["vob"] for f in flags), dtype=np.int32, count=len(flags))
+        vob_ends = np.append(np.flatnonzero(np.diff(vobs) != 0), vobs.size - 1).tolist()
         vob_indexes = [
-            "%s-%s" % ((0 if n == 0 else (vob_indexes[n - 1] + 1)), i)
-            for n, i in enumerate(vob_indexes)
+            "%s-%s" % ((0 if n == 0 else (vob_ends[n - 1] + 1)), i)
+            for n, i in enumerate(vob_ends)
         ]
         clip = core.std.SetFrameProp(clip, prop="PVSVobIdIndexes", data=" ".join(vob_indexes))
 
-        return core.std.FrameEval(
-            clip,
-            functools.partial(
-                _set_flag_props,
-                c=clip,
-                fl=flags
-            ),
-            prop_src=clip
-        )
+        return core.std.ModifyFrame(clip, clip, _set_flag_props)
+
+    @staticmethod
+    def _read_flags_cache(d2v_path: Path) -> Optional[dict]:
+        """
+        Read derived D2V data previously persisted by _write_flags_cache.
+
+        Returns None if there is no cache, it belongs to an older copy of the
+        D2V file, or it cannot be read for any reason. The data is plain .npz
+        arrays, so unlike pickle, reading it never executes anything from it.
+        """
+        cache_path = Path(f"{d2v_path}.npz")
+        if not cache_path.is_file():
+            return None
+        d2v_stat = d2v_path.stat()
+        try:
+            with np.load(cache_path) as cache:
+                if cache["key"].tolist() != [d2v_stat.st_size, d2v_stat.st_mtime]:
+                    return None
+                return dict(cache)
+        except Exception:
+            return None  # a bad cache of any shape must never fail the load
+
+    @staticmethod
+    def _write_flags_cache(
+        d2v_path: Path,
+        flags: list[dict],
+        pulldown: int,
+        pulldown_str: Optional[str],
+        dar: str,
+        videos: list[str]
+    ) -> None:
+        """
+        Persist derived D2V data to an .npz file next to the D2V.
+
+        Re-deriving this data means re-parsing every line of the D2V text on
+        each load, so keep it around keyed on the D2V file's size and
+        modification time; re-indexing the D2V invalidates it automatically.
+        """
+        if not flags:
+            return
+
+        d2v_stat = d2v_path.stat()
+        data: dict[str, Any] = {
+            "flag_%s" % key: np.asarray([f[key] for f in flags])
+            for key in flags[0]
+        }
+        data["pulldown"] = np.asarray(pulldown)
+        data["pulldown_str"] = np.asarray(pulldown_str or "")
+        data["dar"] = np.asarray(dar)
+        data["videos"] = np.asarray(videos)
+        data["key"] = np.asarray([d2v_stat.st_size, d2v_stat.st_mtime], dtype=np.float64)
+
+        # write via a temp file + atomic replace so concurrent loads of the
+        # same D2V can never read (or leave behind) a partially written cache
+        try:
+            with tempfile.NamedTemporaryFile(dir=d2v_path.parent, suffix=".npz", delete=False) as tmp:
+                np.savez(tmp, **data)
+            os.replace(tmp.name, f"{d2v_path}.npz")
+        except OSError:
+            pass  # e.g., read-only directory, not worth failing the load over
 
     @staticmethod
     def _get_flags(d2v: D2V) -> list[dict]:
         """Get Flag Data from D2V object."""
-        return [
-            dict(**flag, vob=d["vob"], cell=d["cell"])
-            for d in d2v.data
-            for flag in d["flags"]
-        ]
+        flags: list[dict] = [None] * sum(len(d["flags"]) for d in d2v.data)  # type: ignore[list-item]
+        i = 0
+        for d in d2v.data:
+            vob = d["vob"]
+            cell = d["cell"]
+            for flag in d["flags"]:
+                flags[i] = {**flag, "vob": vob, "cell": cell}
+                i += 1
+        return flags
 
     @staticmethod
-    def _get_pulldown(flags: list[dict]) -> tuple[int, Optional[str]]:
+    def _get_flag_cols(flags: list[dict]) -> dict[str, np.ndarray]:
+        """
+        Get Flag Data as SoA (structure-of-arrays) columns for vectorized scans.
+
+        The columns must be rebuilt whenever `flags` is replaced, e.g., after
+        frame rate adjustments like ceil() or floor().
+        """
+        n = len(flags)
+        cols: dict[str, np.ndarray] = {
+            "progressive_frame": np.empty(n, dtype=np.uint8),
+            "rff": np.empty(n, dtype=np.uint8),
+            "tff": np.empty(n, dtype=np.uint8),
+            "vob": np.empty(n, dtype=np.int32),
+            "cell": np.empty(n, dtype=np.int32),
+        }
+        for i, f in enumerate(flags):
+            cols["progressive_frame"][i] = f["progressive_frame"]
+            cols["rff"][i] = f["rff"]
+            cols["tff"][i] = f["tff"]
+            cols["vob"][i] = f["vob"]
+            cols["cell"][i] = f["cell"]
+        return cols
+
+    @staticmethod
+    def _get_pulldown(flag_cols: dict[str, np.ndarray]) -> tuple[int, Optional[str]]:
         """
         Get most commonly used Pulldown cycle and syntax string.
         Returns tuple (pulldown, cycle), or (0, None) if Pulldown is not used.
@@ -402,30 +610,26 @@ class MPGG:
         #       exited interlaced sections the right index vs left index were very far apart, messing up
         #       the accuracy of the cycles. I cannot find out why my test source (Family Guy S01E01 USA
         #       NTSC) is still having random different numbers in each (now progressive only) sections.
+        progressive = flag_cols["progressive_frame"].astype(bool)
+        pulldown_indexes = np.flatnonzero(
+            progressive & flag_cols["rff"].astype(bool) & flag_cols["tff"].astype(bool)
+        )
+        # runs of interlaced frames all map to the same cut position, dedupe them
+        # so np.split only allocates a view per actual section
+        cuts = np.unique(np.searchsorted(pulldown_indexes, np.flatnonzero(~progressive)))
         sections = [
             section
-            for split in split_at(
-                [dict(x, i=n) for n, x in enumerate(flags)],
-                lambda flag: not flag["progressive_frame"]
-            )
-            for section in [[flag["i"] for flag in split if flag["rff"] and flag["tff"]]]
-            if section and len(section) > 1
+            for section in np.split(pulldown_indexes, cuts)
+            if section.size > 1
         ]
         if not sections:
             return 0, None
 
-        cycle = Counter([
-            Counter([
-                (right - left)
-                for left, right in zip(indexes[::2], indexes[1::2])
-            ]).most_common(1)[0][0]
-            for indexes in sections
-        ]).most_common(1)[0][0] + 1
-
-        pulldown = ["2"] * math.floor(cycle / 2)
-        if cycle % 2:
-            pulldown.pop()
-            pulldown.append("3")
+        section_cycles = [_get_section_gap_mode(indexes) for indexes in sections]
+        cycle = int(np.bincount(section_cycles).argmax()) + 1
+
+        # e.g., cycle 4 -> "2:2", cycle 5 -> "2:3"
+        pulldown = ["2"] * (cycle // 2 - cycle % 2) + ["3"] * (cycle % 2)
 
         return cycle, ":".join(pulldown)
 
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+import functools
 import math
-from itertools import groupby
 from typing import Any, Union
 
+import numpy as np
 
+
+@functools.lru_cache(maxsize=None)
 def get_aspect_ratio(width: int, height: int) -> str:
     """Calculate the aspect-ratio gcd string from resolution."""
     r = math.gcd(width, height)
     return "%d:%d" % (int(width / r), int(height / r))
 
 
+@functools.lru_cache(maxsize=None)
 def get_par(width: int, height: int, aspect_ratio_w: int, aspect_ratio_h: int) -> str:
     """Calculate the pixel-aspect-ratio string from resolution."""
     par_w = height * aspect_ratio_w
@@ -21,17 +25,23 @@ def get_par(width: int, height: int, aspect_ratio_w: int, aspect_ratio_h: int) -
     return "%d:%d" % (par_w, par_h)
 
 
+# frame rates quantized to fps * 1001 so lookups use exact integer keys
+# instead of fragile float equality, e.g., 30000/1001 -> 30000
+_STANDARDS = {
+    0: "?",
+    24 * 1001: "FILM",
+    25 * 1001: "PAL",
+    50 * 1001: "PALi",
+    30000: "NTSC",
+    60000: "NTSCi",
+    24000: "NTSC (FILM)"
+}
+
+
+@functools.lru_cache(maxsize=None)
 def get_standard(aspect: float) -> str:
     """Convert an aspect float to a standard string."""
-    return {
-        0: "?",
-        24 / 1: "FILM",
-        25 / 1: "PAL",
-        50 / 1: "PALi",
-        30000 / 1001: "NTSC",
-        60000 / 1001: "NTSCi",
-        24000 / 1001: "NTSC (FILM)"
-    }[aspect]
+    return _STANDARDS[round(aspect * 1001)]
 
 
 def group_numbers(numbers: list[int]) -> list[list[int]]:
@@ -47,8 +57,11 @@ def group_numbers(numbers: list[int]) -> list[list[int]]:
     Parameters:
         numbers: list of numbers to group.
     """
-    for k, g in groupby(enumerate(numbers), lambda x: x[0] - x[1]):
-        yield list(map(lambda x: x[1], g))
+    nums = np.asarray(numbers, dtype=np.int64)
+    if not nums.size:
+        return []
+    cuts = np.flatnonzero(np.diff(nums) != 1) + 1
+    return [group.tolist() for group in np.split(nums, cuts)]
 
 
 def list_select_every(data: list[Any], cycle: int, offsets: list[int], inverse: Union[bool, int] = False) -> list[Any]:
@@ -77,11 +90,19 @@ def list_select_every(data: list[Any], cycle: int, offsets: list[int], inverse:
     # TODO: Should this be removed to allow duplicates?
     offsets = set(offsets)
 
-    return [
-        x
-        for n, x in enumerate(data)
-        if (n % cycle in offsets) ^ inverse
-    ]
+    mask = _get_cycle_mask(cycle, tuple(sorted(offsets)), bool(inverse))
+    return [data[i] for i in np.flatnonzero(np.resize(mask, len(data)))]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_cycle_mask(cycle: int, offsets: tuple[int, ...], inverse: bool) -> np.ndarray:
+    """Build the boolean selection mask for one cycle of list_select_every."""
+    mask = np.zeros(cycle, dtype=bool)
+    mask[[offset for offset in offsets if 0 <= offset < cycle]] = True
+    if inverse:
+        mask = ~mask
+    mask.setflags(write=False)
+    return mask
 
 
 __ALL__ = (get_aspect_ratio, get_par, get_standard, group_numbers, list_select_every)